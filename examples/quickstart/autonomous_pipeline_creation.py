@@ -13,6 +13,9 @@ Usage:
 
 import argparse
 import asyncio
+import functools
+import logging
+import re
 import sys
 from datetime import datetime
 from typing import Dict, Any
@@ -26,13 +29,61 @@ from utils.monitoring import track_workflow
 # Setup logging
 logger = setup_logging(__name__)
 
+# System-type detection tables. Each map is compiled into a single
+# alternation regex at import time, so detection is one pass over the
+# prefix instead of a substring scan per key. The alternation sits inside
+# a lookahead so the scan reports a key at every position even when keys
+# overlap (e.g. both "mysql" and "sqlserver" inside "mysqlserver"); the
+# priority tables then break ties in map order — the same precedence the
+# original per-key loop had.
+_SOURCE_TYPE_MAP = {
+    "sqlserver": "sqlserver",
+    "postgres": "postgresql",
+    "mysql": "mysql",
+    "oracle": "oracle",
+    "cosmosdb": "cosmosdb",
+    "blob": "blob_storage",
+    "adls": "data_lake",
+    "api": "rest_api"
+}
+_SOURCE_TYPE_RE = re.compile("(?=(" + "|".join(map(re.escape, _SOURCE_TYPE_MAP)) + "))")
+_SOURCE_TYPE_PRIORITY = {key: i for i, key in enumerate(_SOURCE_TYPE_MAP)}
+
+_DEST_TYPE_MAP = {
+    "datalake": "data_lake",
+    "synapse": "synapse",
+    "databricks": "databricks",
+    "cosmos": "cosmosdb",
+    "sql": "sql_database"
+}
+_DEST_TYPE_RE = re.compile("(?=(" + "|".join(map(re.escape, _DEST_TYPE_MAP)) + "))")
+_DEST_TYPE_PRIORITY = {key: i for i, key in enumerate(_DEST_TYPE_MAP)}
+
+
+# Config loading reads env/secret stores and supervisor construction wires
+# up authenticated agent clients — both are memoized so library callers
+# creating many pipelines pay the cost once. The supervisor factory is
+# keyed on the config itself, so a hand-built AgentConfig gets a supervisor
+# backed by exactly that config while repeat uses of the same config
+# (including the cached env-loaded ones) reuse one supervisor.
+@functools.lru_cache(maxsize=8)
+def _load_config(environment: str) -> AgentConfig:
+    """Load (and cache) the agent configuration for an environment"""
+    return AgentConfig.load_from_env(environment)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_supervisor(config: AgentConfig) -> SupervisorAgent:
+    """Return the SupervisorAgent singleton for this config"""
+    return SupervisorAgent(config)
+
 
 class AutonomousPipelineCreator:
     """Orchestrates autonomous pipeline creation using multiple agents"""
 
     def __init__(self, config: AgentConfig):
         self.config = config
-        self.supervisor = SupervisorAgent(config)
+        self.supervisor = _get_supervisor(config)
 
     async def create_pipeline(
         self,
@@ -55,72 +106,100 @@ class AutonomousPipelineCreator:
         Returns:
             Dict containing pipeline details and execution summary
         """
-        logger.info("🤖 Starting Autonomous Pipeline Creation")
-        logger.info(f"   Source: {source}")
-        logger.info(f"   Destination: {destination}")
-        logger.info(f"   Schedule: {schedule}")
+        # The f-string banners below are evaluated even when the logger is
+        # configured above INFO, so the bigger blocks are gated on the level
+        # check — at production log levels they cost a single boolean test.
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("🤖 Starting Autonomous Pipeline Creation")
+            logger.info(f"   Source: {source}")
+            logger.info(f"   Destination: {destination}")
+            logger.info(f"   Schedule: {schedule}")
 
         # Track the entire workflow
         with track_workflow("autonomous_pipeline_creation") as workflow:
             # Step 1: Analyze requirements
-            logger.info("\nStep 1/6: Analyzing requirements...")
+            logger.info("\nStep 1/2: Analyzing requirements...")
             requirements = await self._analyze_requirements(
                 source, destination, schedule
             )
-            logger.info(f"   ✅ Source: {requirements['source_type']}")
-            logger.info(f"   ✅ Destination: {requirements['destination_type']}")
-            logger.info(f"   ✅ Mode: {requirements['load_mode']}")
-            logger.info(f"   ✅ Schedule: {requirements['schedule_expression']}")
-
-            # Step 2: Provision infrastructure (Infrastructure Agent)
-            logger.info("\nStep 2/6: Provisioning infrastructure...")
-            logger.info("   ⏳ Infrastructure Agent working...")
-
-            infra_result = await self.supervisor.execute_task(
-                agent="infrastructure",
-                task={
-                    "action": "provision",
-                    "resources": requirements["required_resources"],
-                    "environment": self.config.environment,
-                    "estimate_cost": True
-                }
-            )
-
-            logger.info(f"   ✅ {infra_result['resources_created']} resources created")
-            logger.info(f"   💰 Estimated cost: ${infra_result['estimated_monthly_cost']}/month")
-
-            # Step 3: Create pipeline (Pipeline Agent)
-            logger.info("\nStep 3/6: Creating pipeline...")
-            logger.info("   ⏳ Pipeline Agent working...")
-
-            pipeline_result = await self.supervisor.execute_task(
-                agent="pipeline",
-                task={
-                    "action": "create",
-                    "source": source,
-                    "destination": destination,
-                    "mode": requirements["load_mode"],
-                    "watermark_column": requirements.get("watermark_column"),
-                    "schedule": requirements["schedule_expression"],
-                    "data_factory_id": infra_result["data_factory_id"]
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"   ✅ Source: {requirements['source_type']}")
+                logger.info(f"   ✅ Destination: {requirements['destination_type']}")
+                logger.info(f"   ✅ Mode: {requirements['load_mode']}")
+                logger.info(f"   ✅ Schedule: {requirements['schedule_expression']}")
+
+            # Step 2: Execute the agent plan. The supervisor receives the
+            # whole task DAG in one RPC and schedules it server-side, so the
+            # five intermediate round-trips disappear and tasks that only
+            # depend on the pipeline (quality, monitoring, cost) run in
+            # parallel on the supervisor. "$<id>.<field>" references are
+            # resolved from upstream task results as dependencies complete.
+            logger.info("\nStep 2/2: Executing agent plan...")
+            logger.info("   ⏳ Supervisor scheduling 4-6 agents...")
+
+            tasks = [
+                {
+                    "id": "infra",
+                    "agent": "infrastructure",
+                    "task": {
+                        "action": "provision",
+                        "resources": requirements["required_resources"],
+                        "environment": self.config.environment,
+                        "estimate_cost": True
+                    }
+                },
+                {
+                    "id": "pipeline",
+                    "agent": "pipeline",
+                    "deps": ["infra"],
+                    "task": {
+                        "action": "create",
+                        "source": source,
+                        "destination": destination,
+                        "mode": requirements["load_mode"],
+                        "watermark_column": requirements.get("watermark_column"),
+                        "schedule": requirements["schedule_expression"],
+                        "data_factory_id": "$infra.data_factory_id"
+                    }
+                },
+                {
+                    "id": "deploy",
+                    "agent": "deployment",
+                    "deps": ["pipeline", "quality"] if quality_checks else ["pipeline"],
+                    "task": {
+                        "action": "deploy",
+                        "pipeline_id": "$pipeline.pipeline_id",
+                        "environment": "production",
+                        "run_smoke_test": True,
+                        "require_approval": self.config.environment == "prod"
+                    }
+                },
+                {
+                    "id": "monitoring",
+                    "agent": "monitoring",
+                    "deps": ["pipeline"],
+                    "task": {
+                        "action": "setup_monitoring",
+                        "pipeline_id": "$pipeline.pipeline_id",
+                        "alerts": [
+                            {"type": "pipeline_failure", "severity": "high"},
+                            {"type": "data_quality_breach", "severity": "medium"},
+                            {"type": "cost_anomaly", "severity": "low"}
+                        ],
+                        "create_dashboard": True
+                    }
                 }
-            )
-
-            logger.info(f"   ✅ Pipeline '{pipeline_result['pipeline_name']}' created")
-            logger.info(f"   ✅ Watermark logic configured")
-            logger.info(f"   ✅ Schedule trigger created")
+            ]
 
-            # Step 4: Add data quality validations (Data Quality Agent)
             if quality_checks:
-                logger.info("\nStep 4/6: Adding data quality validations...")
-                logger.info("   ⏳ Data Quality Agent working...")
-
-                quality_result = await self.supervisor.execute_task(
-                    agent="data-quality",
-                    task={
+                tasks.append({
+                    "id": "quality",
+                    "agent": "data-quality",
+                    "deps": ["pipeline"],
+                    "task": {
                         "action": "create_validations",
                         "source": source,
-                        "pipeline_id": pipeline_result["pipeline_id"],
+                        "pipeline_id": "$pipeline.pipeline_id",
                         "auto_profile": True,
                         "validation_types": [
                             "uniqueness",
@@ -129,85 +208,55 @@ class AutonomousPipelineCreator:
                             "range"
                         ]
                     }
-                )
-
-                logger.info(f"   ✅ Data profiling complete")
-                logger.info(f"   ✅ {quality_result['rules_created']} validation rules created")
-                logger.info(f"   ✅ Integrated with pipeline")
-            else:
-                quality_result = {"rules_created": 0}
-                logger.info("\nStep 4/6: Skipping data quality validations")
+                })
 
-            # Step 5: Deploy to production (Deployment Agent)
-            logger.info("\nStep 5/6: Deploying to production...")
-            logger.info("   ⏳ Deployment Agent working...")
-
-            deployment_result = await self.supervisor.execute_task(
-                agent="deployment",
-                task={
-                    "action": "deploy",
-                    "pipeline_id": pipeline_result["pipeline_id"],
-                    "environment": "production",
-                    "run_smoke_test": True,
-                    "require_approval": self.config.environment == "prod"
-                }
-            )
-
-            logger.info(f"   ✅ Deployed to production")
-            logger.info(f"   ✅ Smoke test {'passed' if deployment_result['smoke_test_passed'] else 'failed'}")
-            logger.info(f"   ✅ Schedule activated")
-
-            # Step 6: Setup monitoring (Monitoring Agent)
-            logger.info("\nStep 6/6: Setting up monitoring...")
-            logger.info("   ⏳ Monitoring Agent working...")
-
-            monitoring_result = await self.supervisor.execute_task(
-                agent="monitoring",
-                task={
-                    "action": "setup_monitoring",
-                    "pipeline_id": pipeline_result["pipeline_id"],
-                    "alerts": [
-                        {"type": "pipeline_failure", "severity": "high"},
-                        {"type": "data_quality_breach", "severity": "medium"},
-                        {"type": "cost_anomaly", "severity": "low"}
-                    ],
-                    "create_dashboard": True
-                }
-            )
-
-            logger.info(f"   ✅ {monitoring_result['alerts_created']} alerts configured")
-            logger.info(f"   ✅ Dashboard created")
-
-            # Cost optimization (optional)
             if cost_optimize:
-                logger.info("\nBonus: Cost Optimization...")
-                logger.info("   ⏳ Cost Optimizer Agent working...")
-
-                cost_result = await self.supervisor.execute_task(
-                    agent="cost-optimizer",
-                    task={
+                tasks.append({
+                    "id": "cost",
+                    "agent": "cost-optimizer",
+                    "deps": ["pipeline"],
+                    "task": {
                         "action": "optimize_pipeline",
-                        "pipeline_id": pipeline_result["pipeline_id"],
+                        "pipeline_id": "$pipeline.pipeline_id",
                         "apply_recommendations": True
                     }
-                )
-
-                if cost_result.get("savings_found"):
-                    logger.info(f"   💰 Optimizations applied: ${cost_result['monthly_savings']}/month saved")
-                else:
-                    logger.info(f"   ✅ Pipeline already optimized")
-
-            # Summary
-            logger.info("\n🎉 Pipeline Created Successfully!\n")
-            logger.info("Summary:")
-            logger.info(f"  Pipeline ID: {pipeline_result['pipeline_name']}")
-            logger.info(f"  Status: Active")
-            logger.info(f"  Next Run: {pipeline_result['next_run_time']}")
-            logger.info(f"  Estimated Monthly Cost: ${infra_result['estimated_monthly_cost']}")
-            logger.info(f"  Data Quality Rules: {quality_result['rules_created']} active")
-            logger.info(f"  Monitoring Dashboard: {monitoring_result['dashboard_url']}")
-            logger.info(f"\nTotal Time: {workflow.duration}")
-            logger.info(f"(vs. 2-3 weeks manual process)")
+                })
+
+            plan_results = await self.supervisor.execute_plan(tasks)
+
+            infra_result = plan_results["infra"]
+            pipeline_result = plan_results["pipeline"]
+            deployment_result = plan_results["deploy"]
+            monitoring_result = plan_results["monitoring"]
+            quality_result = plan_results["quality"] if quality_checks else {"rules_created": 0}
+            cost_result = plan_results["cost"] if cost_optimize else None
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"   ✅ {infra_result['resources_created']} resources created")
+                logger.info(f"   💰 Estimated cost: ${infra_result['estimated_monthly_cost']}/month")
+                logger.info(f"   ✅ Pipeline '{pipeline_result['pipeline_name']}' created")
+                logger.info(f"   ✅ Deployed to production")
+                logger.info(f"   ✅ Smoke test {'passed' if deployment_result['smoke_test_passed'] else 'failed'}")
+                logger.info(f"   ✅ {quality_result['rules_created']} validation rules created")
+                logger.info(f"   ✅ {monitoring_result['alerts_created']} alerts configured")
+
+                if cost_result is not None:
+                    if cost_result.get("savings_found"):
+                        logger.info(f"   💰 Optimizations applied: ${cost_result['monthly_savings']}/month saved")
+                    else:
+                        logger.info(f"   ✅ Pipeline already optimized")
+
+                # Summary
+                logger.info("\n🎉 Pipeline Created Successfully!\n")
+                logger.info("Summary:")
+                logger.info(f"  Pipeline ID: {pipeline_result['pipeline_name']}")
+                logger.info(f"  Status: Active")
+                logger.info(f"  Next Run: {pipeline_result['next_run_time']}")
+                logger.info(f"  Estimated Monthly Cost: ${infra_result['estimated_monthly_cost']}")
+                logger.info(f"  Data Quality Rules: {quality_result['rules_created']} active")
+                logger.info(f"  Monitoring Dashboard: {monitoring_result['dashboard_url']}")
+                logger.info(f"\nTotal Time: {workflow.duration}")
+                logger.info(f"(vs. 2-3 weeks manual process)")
 
             return {
                 "pipeline_id": pipeline_result["pipeline_id"],
@@ -238,18 +287,19 @@ class AutonomousPipelineCreator:
         # Determine load mode
         load_mode = "incremental" if source_type in ["sqlserver", "postgresql", "mysql"] else "full"
 
-        # Determine watermark column
-        watermark_column = None
+        # Kick off watermark detection in the background — the agent call is
+        # network-bound and independent of the local schedule/resource work,
+        # so it overlaps with the computation below.
+        watermark_task = None
         if load_mode == "incremental":
             # Use AI agent to detect best watermark column
-            result = await self.supervisor.execute_task(
+            watermark_task = asyncio.create_task(self.supervisor.execute_task(
                 agent="pipeline",
                 task={
                     "action": "detect_watermark_column",
                     "source": source
                 }
-            )
-            watermark_column = result.get("watermark_column", "modified_date")
+            ))
 
         # Parse schedule
         schedule_expression = self._parse_schedule(schedule)
@@ -257,6 +307,11 @@ class AutonomousPipelineCreator:
         # Determine required resources
         required_resources = self._determine_resources(source_type, destination_type)
 
+        watermark_column = None
+        if watermark_task is not None:
+            result = await watermark_task
+            watermark_column = result.get("watermark_column", "modified_date")
+
         return {
             "source_type": source_type,
             "destination_type": destination_type,
@@ -268,36 +323,25 @@ class AutonomousPipelineCreator:
 
     def _detect_source_type(self, source_prefix: str) -> str:
         """Detect source system type"""
-        source_mapping = {
-            "sqlserver": "sqlserver",
-            "postgres": "postgresql",
-            "mysql": "mysql",
-            "oracle": "oracle",
-            "cosmosdb": "cosmosdb",
-            "blob": "blob_storage",
-            "adls": "data_lake",
-            "api": "rest_api"
-        }
-        for key, value in source_mapping.items():
-            if key in source_prefix.lower():
-                return value
-        return "unknown"
+        hits = _SOURCE_TYPE_RE.findall(source_prefix.lower())
+        if not hits:
+            return "unknown"
+        return _SOURCE_TYPE_MAP[min(hits, key=_SOURCE_TYPE_PRIORITY.__getitem__)]
 
     def _detect_destination_type(self, dest_prefix: str) -> str:
         """Detect destination type"""
-        dest_mapping = {
-            "datalake": "data_lake",
-            "synapse": "synapse",
-            "databricks": "databricks",
-            "cosmos": "cosmosdb",
-            "sql": "sql_database"
-        }
-        for key, value in dest_mapping.items():
-            if key in dest_prefix.lower():
-                return value
-        return "data_lake"  # default
-
-    def _parse_schedule(self, schedule: str) -> str:
+        hits = _DEST_TYPE_RE.findall(dest_prefix.lower())
+        if not hits:
+            return "data_lake"  # default
+        return _DEST_TYPE_MAP[min(hits, key=_DEST_TYPE_PRIORITY.__getitem__)]
+
+    # Both helpers are pure functions of their arguments with a small set of
+    # repeating inputs, so they are static and memoized — repeat pipeline
+    # creations hit the cache instead of recomputing.
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _parse_schedule(schedule: str) -> str:
         """Convert human-readable schedule to cron expression"""
         schedule_mapping = {
             "hourly": "0 * * * *",
@@ -308,8 +352,11 @@ class AutonomousPipelineCreator:
         }
         return schedule_mapping.get(schedule.lower(), schedule)
 
-    def _determine_resources(self, source_type: str, destination_type: str) -> list:
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _determine_resources(source_type: str, destination_type: str) -> tuple:
         """Determine required Azure resources"""
+        # Returns a tuple so callers can't mutate the cached value
         resources = ["data_factory", "storage_account"]
 
         if destination_type == "synapse":
@@ -320,7 +367,7 @@ class AutonomousPipelineCreator:
         if source_type in ["sqlserver", "postgresql", "mysql"]:
             resources.append("integration_runtime")
 
-        return resources
+        return tuple(resources)
 
 
 async def main():
@@ -336,7 +383,7 @@ async def main():
     args = parser.parse_args()
 
     # Load configuration
-    config = AgentConfig.load_from_env(args.environment)
+    config = _load_config(args.environment)
 
     # Create pipeline creator
     creator = AutonomousPipelineCreator(config)
@@ -360,4 +407,14 @@ async def main():
 
 
 if __name__ == "__main__":
+    # uvloop's libuv event loop is a drop-in upgrade for the awaited agent
+    # round-trips this workflow is dominated by; fall back to the stdlib
+    # loop where it isn't available (e.g. Windows).
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+
     asyncio.run(main())